@@ -1,12 +1,44 @@
 #!/usr/bin/env python
 
+import mmap
+
+
+def _normalize_newlines(data):
+    # Same line endings as a text-mode read (universal newlines): '\r\n' and
+    # a lone '\r' both become '\n', the only line break the tokenizer knows.
+    return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
 def read_source(file_path):
-    with open(file_path, 'r') as file:
-        txt = file.readlines()
-    return ''.join(one.strip() + '\n' for one in txt)
+    # Read the raw bytes in one go: the tokenizer scans bytes and only
+    # decodes lexemes, so there is no up-front decode of the whole file.
+    with open(file_path, 'rb') as file:
+        return _normalize_newlines(file.read())
+
+
+def read_source_mmap(file_path):
+    r"""Map the file read-only and return the buffer.
+
+    The buffer can be handed straight to Tokenizer.tokenize(); pages are
+    loaded on demand instead of copying the whole file up front. A file
+    containing '\r' is copied once with its line endings turned into '\n'.
+    Such files and empty ones come back as bytes; a returned mmap is the
+    caller's to close.
+    """
+    with open(file_path, 'rb') as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            buffer = b''
+    if buffer.find(b'\r') != -1:
+        normalized = _normalize_newlines(buffer[:])
+        buffer.close()
+        buffer = normalized
+    return buffer
 
 
 if __name__ == "__main__":
     # Example usage
     source = read_source("SourceCode.c")
-    print(source)
+    print(source.decode('utf-8', 'replace'))
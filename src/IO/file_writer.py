@@ -1,10 +1,7 @@
 #!/usr/bin/env python
 
 import json
-
-def _serialize(tokens):
-    return [t.to_dict() for t in tokens]
-
+from lexer.token_types import TYPE_NAMES
 
 def write_tokens(tokens, file_path):
     file_ext = file_path.split('.')[-1].lower()
@@ -12,7 +9,12 @@ def write_tokens(tokens, file_path):
     if file_ext not in ['json']:
         raise ValueError(f"Unsupported file extension: .{file_ext}")
 
-    data = _serialize(tokens)
+    data = [
+        {"value": t.value, "type": TYPE_NAMES[t.type], "line": t.line, "column": t.column}
+        for t in tokens
+    ]
+    # Compact one-shot encoding goes through the C encoder; indent= forces
+    # the pure-Python one and inflates the file several times over.
     with open(file_path, 'w') as file:
-        json.dump(data, file, indent=2)
+        file.write(json.dumps(data, separators=(',', ':')))
 
@@ -2,20 +2,23 @@
 from lexer import token_types
 
 class Token:
-    def __init__(self, value: str, token_type: token_types.TokenType, line: int | None = None, column: int | None = None):
+    __slots__ = ('value', 'type', 'line', 'column', 'kind')
+
+    def __init__(self, value: str, token_type: token_types.TokenType | None, line: int | None = None, column: int | None = None,
+                 kind: token_types.TokenKind | None = None):
         self.value = value
         self.type = token_type
         self.line = line
         self.column = column
+        # The tokenizer passes the kind it already knows. Otherwise keyword/
+        # operator/punctuation lexemes get their own kind, and anything else
+        # falls back to the kind for its type.
+        if kind is None:
+            kind = token_types.KIND_BY_LEXEME.get(value) or token_types.TYPE_KINDS[token_type]
+        self.kind = kind
 
     def __repr__(self):
         loc = f"@{self.line}:{self.column}" if self.line is not None and self.column is not None else ""
-        return f"({self.value}, {self.type.name}{(' ' + loc) if loc else ''})"
-
-    def to_dict(self):
-        return {
-            "value": self.value,
-            "type": self.type.name,
-            "line": self.line,
-            "column": self.column,
-        }
+        # The parser's EOF sentinel is the only token without a type
+        type_name = self.type.name if self.type is not None else "EOF"
+        return f"({self.value}, {type_name}{(' ' + loc) if loc else ''})"
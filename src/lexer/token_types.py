@@ -1,13 +1,141 @@
 ## token categories
-from enum import Enum
-
-class TokenType(Enum):
-    KEYWORD = "Keyword"
-    IDENTIFIER = "Identifier"
-    OPERATOR = "Operator"
-    NUMERIC_CONSTANT = "Numeric Constant"
-    CHARACTER_CONSTANT = "Character Constant"
-    SPECIAL_CHARACTER = "Special Character"
-    COMMENT = "Comment"
-    WHITESPACE = "White Space"
-    NEWLINE = "New line"
+from enum import IntEnum, auto
+
+class TokenType(IntEnum):
+    KEYWORD = 0
+    IDENTIFIER = 1
+    OPERATOR = 2
+    NUMERIC_CONSTANT = 3
+    CHARACTER_CONSTANT = 4
+    SPECIAL_CHARACTER = 5
+    COMMENT = 6
+    WHITESPACE = 7
+    NEWLINE = 8
+
+# Token types the parser never looks at
+TRIVIA = frozenset({TokenType.COMMENT, TokenType.WHITESPACE, TokenType.NEWLINE})
+
+# Type names indexed by TokenType value, for hot paths that would otherwise
+# go through the Enum.name descriptor per token
+TYPE_NAMES = tuple(tt.name for tt in TokenType)
+
+
+class TokenKind(IntEnum):
+    """Finer classification than TokenType: one member per keyword and
+    operator/punctuation lexeme, so the parser compares enum members
+    instead of strings. Output (JSON, summaries) still uses TokenType."""
+    OTHER = 0
+    IDENTIFIER = auto()
+    NUMBER = auto()
+    CHARACTER = auto()
+
+    # Keywords
+    INT_KW = auto()
+    FLOAT_KW = auto()
+    CHAR_KW = auto()
+    DOUBLE_KW = auto()
+    IF_KW = auto()
+    ELSE_KW = auto()
+    FOR_KW = auto()
+    WHILE_KW = auto()
+    DO_KW = auto()
+    RETURN_KW = auto()
+    VOID_KW = auto()
+    SWITCH_KW = auto()
+    CASE_KW = auto()
+    BREAK_KW = auto()
+    CONTINUE_KW = auto()
+    STRUCT_KW = auto()
+    TYPEDEF_KW = auto()
+    STATIC_KW = auto()
+    CONST_KW = auto()
+    UNSIGNED_KW = auto()
+    SIGNED_KW = auto()
+
+    # Operators
+    PLUS = auto()
+    MINUS = auto()
+    STAR = auto()
+    SLASH = auto()
+    PERCENT = auto()
+    ASSIGN = auto()
+    EQ = auto()
+    NE = auto()
+    GT = auto()
+    LT = auto()
+    GE = auto()
+    LE = auto()
+    AND_AND = auto()
+    OR_OR = auto()
+    PLUS_PLUS = auto()
+    MINUS_MINUS = auto()
+    AMP = auto()
+    PIPE = auto()
+    BANG = auto()
+    CARET = auto()
+
+    # Special characters
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
+    LBRACKET = auto()
+    RBRACKET = auto()
+    SEMI = auto()
+    COMMA = auto()
+    DOT = auto()
+    HASH = auto()
+
+    # End-of-input sentinel the parser appends; never produced by the tokenizer
+    EOF = auto()
+
+# Fixed lexeme -> kind, for keywords, operators and special characters
+KIND_BY_LEXEME = {
+    "int": TokenKind.INT_KW, "float": TokenKind.FLOAT_KW, "char": TokenKind.CHAR_KW,
+    "double": TokenKind.DOUBLE_KW, "if": TokenKind.IF_KW, "else": TokenKind.ELSE_KW,
+    "for": TokenKind.FOR_KW, "while": TokenKind.WHILE_KW, "do": TokenKind.DO_KW,
+    "return": TokenKind.RETURN_KW, "void": TokenKind.VOID_KW, "switch": TokenKind.SWITCH_KW,
+    "case": TokenKind.CASE_KW, "break": TokenKind.BREAK_KW, "continue": TokenKind.CONTINUE_KW,
+    "struct": TokenKind.STRUCT_KW, "typedef": TokenKind.TYPEDEF_KW, "static": TokenKind.STATIC_KW,
+    "const": TokenKind.CONST_KW, "unsigned": TokenKind.UNSIGNED_KW, "signed": TokenKind.SIGNED_KW,
+    "+": TokenKind.PLUS, "-": TokenKind.MINUS, "*": TokenKind.STAR, "/": TokenKind.SLASH,
+    "%": TokenKind.PERCENT, "=": TokenKind.ASSIGN, "==": TokenKind.EQ, "!=": TokenKind.NE,
+    ">": TokenKind.GT, "<": TokenKind.LT, ">=": TokenKind.GE, "<=": TokenKind.LE,
+    "&&": TokenKind.AND_AND, "||": TokenKind.OR_OR, "++": TokenKind.PLUS_PLUS,
+    "--": TokenKind.MINUS_MINUS, "&": TokenKind.AMP, "|": TokenKind.PIPE,
+    "!": TokenKind.BANG, "^": TokenKind.CARET,
+    "(": TokenKind.LPAREN, ")": TokenKind.RPAREN, "{": TokenKind.LBRACE, "}": TokenKind.RBRACE,
+    "[": TokenKind.LBRACKET, "]": TokenKind.RBRACKET, ";": TokenKind.SEMI, ",": TokenKind.COMMA,
+    ".": TokenKind.DOT, "#": TokenKind.HASH,
+}
+
+# Kind for tokens whose lexeme is not fixed, indexed by TokenType value
+TYPE_KINDS = tuple(
+    {
+        TokenType.IDENTIFIER: TokenKind.IDENTIFIER,
+        TokenType.NUMERIC_CONSTANT: TokenKind.NUMBER,
+        TokenType.CHARACTER_CONSTANT: TokenKind.CHARACTER,
+    }.get(tt, TokenKind.OTHER)
+    for tt in TokenType
+)
+
+
+def check_kind_table():
+    """Raise RuntimeError if KIND_BY_LEXEME and the scanner's lexeme sets differ.
+
+    A lexeme the scanner knows but this table does not would silently get
+    TokenKind.OTHER. Run from src/ with: python -m lexer.token_types
+    """
+    from lexer.scanner import KEYWORDS, OPERATORS, SPECIAL_CHARACTERS
+    fixed = KEYWORDS | OPERATORS | SPECIAL_CHARACTERS
+    if KIND_BY_LEXEME.keys() != fixed:
+        raise RuntimeError(
+            "KIND_BY_LEXEME is out of sync with lexer.scanner: "
+            f"missing {sorted(fixed - KIND_BY_LEXEME.keys())}, "
+            f"unknown {sorted(KIND_BY_LEXEME.keys() - fixed)}"
+        )
+
+
+if __name__ == "__main__":
+    check_kind_table()
+    print("KIND_BY_LEXEME matches the scanner's lexeme sets")
@@ -1,61 +1,203 @@
 # Logic tokenize
 
+import mmap
 import re
+import sys
 from lexer.token import Token
 import lexer.token_types as token_types
 from lexer.scanner import Scanner
 
+# The scanner works on bytes: indexing yields ints, so iterating these
+# gives the jump-table slots for each character class.
+_DIGITS = b"0123456789"
+_IDENT_START = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_"
+_WHITESPACE_BYTES = bytes(i for i in range(128) if chr(i).isspace())
+
+# Once a handler has been picked, the rest of the lexeme is matched in C by
+# these anchored patterns instead of a per-byte Python loop.
+_IDENT_TAIL_RE = re.compile(rb'[A-Za-z0-9_]*')
+_NUMBER_RE = re.compile(rb'[0-9]+(?:\.[0-9]+)?')
+_WHITESPACE_RE = re.compile(b'[' + re.escape(_WHITESPACE_BYTES) + b']+')
+
+# TokenType members the handlers return
+_CHARACTER_CONSTANT = token_types.TokenType.CHARACTER_CONSTANT
+_COMMENT = token_types.TokenType.COMMENT
+_IDENTIFIER = token_types.TokenType.IDENTIFIER
+_KEYWORD = token_types.TokenType.KEYWORD
+_NEWLINE = token_types.TokenType.NEWLINE
+_NUMERIC_CONSTANT = token_types.TokenType.NUMERIC_CONSTANT
+_OPERATOR = token_types.TokenType.OPERATOR
+_SPECIAL_CHARACTER = token_types.TokenType.SPECIAL_CHARACTER
+_WHITESPACE = token_types.TokenType.WHITESPACE
+
+# Token types whose lexeme may contain a newline
+_MULTILINE = frozenset({_CHARACTER_CONSTANT, _COMMENT, _NEWLINE, _WHITESPACE})
+
+# Kinds for the handlers whose lexemes are not fixed
+_KIND_CHARACTER = token_types.TokenKind.CHARACTER
+_KIND_IDENTIFIER = token_types.TokenKind.IDENTIFIER
+_KIND_NUMBER = token_types.TokenKind.NUMBER
+_KIND_OTHER = token_types.TokenKind.OTHER
+
 class Tokenizer:
     def __init__(self):
         self.scanner = Scanner()
+        # Fixed lexemes are interned once, so every "int" or ";" token shares
+        # one str object (and compares by identity first). Each is stored with
+        # its TokenKind so Token() never has to look the kind up.
+        kinds = token_types.KIND_BY_LEXEME
+        self.keyword_lexemes = {
+            kw.encode(): (sys.intern(kw), kinds[kw]) for kw in self.scanner.keywords
+        }
+        self.multi_char_operators = {
+            op.encode(): (sys.intern(op), kinds[op]) for op in self.scanner.operators if len(op) == 2
+        }
+        self.char_lexemes = [sys.intern(chr(i)) for i in range(128)]
+        self.char_kinds = [kinds.get(chr(i), _KIND_OTHER) for i in range(128)]
+        self.max_keyword_length = max(len(kw) for kw in self.scanner.keywords)
+
+        # Jump table: first byte of a lexeme -> handler.
+        # Every handler takes (code, i) and returns (lexeme, token_type, kind, new_i).
+        self.dispatch = [None] * 128
+        for ch in self.scanner.operators:
+            self.dispatch[ord(ch[0])] = self._scan_operator
+        for ch in self.scanner.special_characters:
+            self.dispatch[ord(ch)] = self._scan_special_character
+        for c in _IDENT_START:
+            self.dispatch[c] = self._scan_identifier
+        # Only words starting with one of these bytes can be keywords; the
+        # rest never pay for a keyword lookup.
+        for kw in self.scanner.keywords:
+            self.dispatch[ord(kw[0])] = self._scan_identifier_or_keyword
+        for c in _DIGITS:
+            self.dispatch[c] = self._scan_number
+        for c in _WHITESPACE_BYTES:
+            self.dispatch[c] = self._scan_whitespace
+        self.dispatch[ord('/')] = self._scan_slash
+        self.dispatch[ord("'")] = self._scan_character_constant
+
+        # Offset of the first '/*' known to have no closing '*/'; reset by tokenize()
+        self._no_comment_end_after = 0
+
+    # --- Handlers ---------------------------------------------------------
+
+    def _scan_slash(self, code, i):
+        nxt = code[i + 1:i + 2]
+        if nxt == b'/':
+            end = code.find(b'\n', i)
+            if end == -1:
+                end = len(code)
+            return code[i:end].decode('utf-8', 'replace'), _COMMENT, _KIND_OTHER, end
+        if nxt == b'*' and i < self._no_comment_end_after:
+            end = code.find(b'*/', i + 2)
+            if end != -1:
+                end += 2
+                return code[i:end].decode('utf-8', 'replace'), _COMMENT, _KIND_OTHER, end
+            # No '*/' anywhere after this point: this and every later '/*'
+            # lex as operators (so the parser still rejects them) without
+            # searching again.
+            self._no_comment_end_after = i
+        return self._scan_operator(code, i)
+
+    def _scan_operator(self, code, i):
+        pair = code[i:i + 2]
+        op = self.multi_char_operators.get(pair)
+        if op is not None:
+            return op[0], _OPERATOR, op[1], i + 2
+        c = code[i]
+        return self.char_lexemes[c], _OPERATOR, self.char_kinds[c], i + 1
+
+    def _scan_special_character(self, code, i):
+        c = code[i]
+        return self.char_lexemes[c], _SPECIAL_CHARACTER, self.char_kinds[c], i + 1
+
+    def _scan_character_constant(self, code, i):
+        if i + 2 < len(code) and code[i + 1] != 0x27 and code[i + 2] == 0x27:
+            return code[i:i + 3].decode('utf-8', 'replace'), _CHARACTER_CONSTANT, _KIND_CHARACTER, i + 3
+        # A non-ASCII character takes 2-4 bytes in UTF-8; accept it only if
+        # the bytes between the quotes decode to exactly one character.
+        end = code.find(b"'", i + 3, i + 6)
+        if end != -1:
+            try:
+                inner = code[i + 1:end].decode('utf-8')
+            except UnicodeDecodeError:
+                inner = ''
+            if len(inner) == 1:
+                return code[i:end + 1].decode(), _CHARACTER_CONSTANT, _KIND_CHARACTER, end + 1
+        # A lone quote does not start any lexeme
+        return None, None, None, i + 1
+
+    def _scan_identifier(self, code, i):
+        j = _IDENT_TAIL_RE.match(code, i + 1).end()
+        return code[i:j].decode(), _IDENTIFIER, _KIND_IDENTIFIER, j
+
+    def _scan_identifier_or_keyword(self, code, i):
+        j = _IDENT_TAIL_RE.match(code, i + 1).end()
+        word = code[i:j]
+        if j - i <= self.max_keyword_length:
+            keyword = self.keyword_lexemes.get(word)
+            if keyword is not None:
+                return keyword[0], _KEYWORD, keyword[1], j
+        return word.decode(), _IDENTIFIER, _KIND_IDENTIFIER, j
+
+    def _scan_number(self, code, i):
+        j = _NUMBER_RE.match(code, i).end()
+        return code[i:j].decode(), _NUMERIC_CONSTANT, _KIND_NUMBER, j
+
+    def _scan_whitespace(self, code, i):
+        j = _WHITESPACE_RE.match(code, i).end()
+        if j == i + 1 and code[i] == 0x0A:
+            return self.char_lexemes[0x0A], _NEWLINE, _KIND_OTHER, j
+        return code[i:j].decode(), _WHITESPACE, _KIND_OTHER, j
+
+    # --- Driver -----------------------------------------------------------
+
+    def tokenize(self, code, keep_trivia: bool = False):
+        """Split code into tokens.
+
+        code may be a str, bytes, an mmap, or any other bytes-like buffer
+        (bytearray, memoryview). A str is encoded once as UTF-8 and other
+        buffers are copied to bytes once; columns are counted in bytes.
+
+        Comments, whitespace and newlines are only emitted when keep_trivia
+        is True; the parser works on the trivia-free stream.
+        """
+        if isinstance(code, str):
+            code = code.encode('utf-8')
+        elif not isinstance(code, (bytes, mmap.mmap)):
+            # Handlers use slices as dict keys, which must be hashable bytes
+            code = bytes(code)
 
-        self.token_pattern = re.compile(
-            r"""
-            (//[^\n]*)                        # Single-line comment
-            |(/\*.*?\*/)                      # Multi-line comment
-            |('[^']')                         # Character constant
-            |(\d+\.\d+|\d+)                   # Numeric constant (float/int)
-            |([A-Za-z_][A-Za-z0-9_]*)         # Identifiers and keywords
-            |(==|!=|>=|<=|\+\+|--|&&|\|\|)    # Multi-char operators
-            |([+\-*/%=><!&|^])                # Single-char operators
-            |([\(\){}\[\];,\.#])              # Special characters
-            |(\s+)                            # Whitespace
-            """,
-            re.DOTALL | re.VERBOSE
-        )
-
-    def tokenize(self, code: str):
         tokens = []
-        for match in re.finditer(self.token_pattern, code):
-            lexeme = match.group(0)
-            start = match.start()
-            # Compute line and column from start index
-            # Line numbers start at 1; column starts at 1
-            line = code.count('\n', 0, start) + 1
-            last_nl = code.rfind('\n', 0, start)
-            column = (start - last_nl) if last_nl != -1 else (start + 1)
-
-            if self.scanner.is_comment(lexeme):
-                token_type = token_types.TokenType.COMMENT
-            elif self.scanner.is_keyword(lexeme):
-                token_type = token_types.TokenType.KEYWORD
-            elif self.scanner.is_operator(lexeme):
-                token_type = token_types.TokenType.OPERATOR
-            elif self.scanner.is_special_character(lexeme):
-                token_type = token_types.TokenType.SPECIAL_CHARACTER
-            elif self.scanner.is_character_constant(lexeme):
-                token_type = token_types.TokenType.CHARACTER_CONSTANT
-            elif self.scanner.is_numeric_constant(lexeme):
-                token_type = token_types.TokenType.NUMERIC_CONSTANT
-            elif self.scanner.is_identifier(lexeme):
-                token_type = token_types.TokenType.IDENTIFIER
-            elif self.scanner.is_newline(lexeme):
-                token_type = token_types.TokenType.NEWLINE
-            elif self.scanner.is_whitespace(lexeme):
-                token_type = token_types.TokenType.WHITESPACE
-            else:
-                token_type = token_types.TokenType.IDENTIFIER
-
-            tokens.append(Token(lexeme, token_type, line=line, column=column))
-
-        return tokens
\ No newline at end of file
+        trivia = token_types.TRIVIA
+        multiline = _MULTILINE
+        dispatch = self.dispatch
+        n = len(code)
+        self._no_comment_end_after = n
+        i = 0
+        # Line numbers start at 1; column starts at 1
+        line = 1
+        line_start = 0
+        while i < n:
+            start = i
+            c = code[i]
+            # Non-ASCII bytes never start a lexeme
+            handler = dispatch[c] if c < 128 else None
+            if handler is None:
+                i += 1
+                continue
+            lexeme, token_type, kind, i = handler(code, i)
+            if lexeme is None:
+                continue
+
+            if keep_trivia or token_type not in trivia:
+                tokens.append(Token(lexeme, token_type, line, start - line_start + 1, kind))
+
+            # Only whitespace, comments and character constants can span lines
+            if token_type in multiline:
+                newlines = lexeme.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = code.rfind(b'\n', start, i) + 1
+
+        return tokens
@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 
 import argparse
+import mmap
 import sys
 from lexer.tokenizer import Tokenizer
-from IO.file_reader import read_source
+from IO.file_reader import read_source_mmap
 from IO.file_writer import write_tokens
 from lexer.token_types import TokenType
 from parser.parser import Parser, ParserError
@@ -38,14 +39,19 @@ def main():
 
     # INPUT
     try:
-        source_code = read_source(args.input_file)
+        source_code = read_source_mmap(args.input_file)
     except FileNotFoundError:
         print(f"❌ Error: File '{args.input_file}' not found.")
         sys.exit(1)
 
     # TOKENIZATION
     tokenizer = Tokenizer()
-    tokens = tokenizer.tokenize(source_code)
+    try:
+        tokens = tokenizer.tokenize(source_code, keep_trivia=True)
+    finally:
+        # Tokens hold decoded strings, so the mapping is no longer needed
+        if isinstance(source_code, mmap.mmap):
+            source_code.close()
     
     # PARSING
     parser = Parser(tokens)
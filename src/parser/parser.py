@@ -1,5 +1,64 @@
 from lexer.token import Token
-from lexer.token_types import TokenType
+from lexer.token_types import TokenType, TokenKind, TRIVIA
+
+# TypeSpec → 'int' | 'float' | 'void'; every rule that needs a TypeSpec tests
+# membership here and consumes it inline
+_TYPE_SPECS = frozenset({TokenKind.INT_KW, TokenKind.FLOAT_KW, TokenKind.VOID_KW})
+# ParamList alternatives with no TypeSpec ID: '(void)' and '()'
+_EMPTY_PARAMS = frozenset({TokenKind.VOID_KW, TokenKind.RPAREN})
+
+# Stmt alternatives, keyed by the token kind that starts each one:
+# IfStmt, WhileStmt, ForStmt, ReturnStmt, CompoundStmt, ExprStmt
+_STMT_RULES = {
+    TokenKind.IF_KW: "parse_if_stmt",
+    TokenKind.WHILE_KW: "parse_while_stmt",
+    TokenKind.FOR_KW: "parse_for_stmt",
+    TokenKind.RETURN_KW: "parse_return_stmt",
+    TokenKind.LBRACE: "parse_compound_stmt",
+    TokenKind.IDENTIFIER: "parse_expr_stmt",
+}
+
+# Token kinds that start each nonterminal, as the parser accepts it. They are
+# derived from the tables above so the predicates and rules cannot drift apart.
+_FIRST_DECL = _TYPE_SPECS
+# Mirrors the statements the parser accepts, not the grammar's FIRST(Stmt):
+# Grammar.txt has ExprStmt → ';', but like the original parser a StmtList
+# does not start a statement on a bare ';', so SEMI is left out.
+_FIRST_STMT = frozenset(_STMT_RULES)
+_FIRST_EXPR = frozenset({TokenKind.IDENTIFIER, TokenKind.NUMBER, TokenKind.LPAREN})
+
+# Binary operators by grammar level, loosest first:
+# OrExpr, AndExpr, RelExpr, AddExpr, Term
+_PRECEDENCE_LEVELS = (
+    (TokenKind.OR_OR,),
+    (TokenKind.AND_AND,),
+    (TokenKind.LT, TokenKind.LE, TokenKind.GT, TokenKind.GE, TokenKind.EQ, TokenKind.NE),
+    (TokenKind.PLUS, TokenKind.MINUS),
+    (TokenKind.STAR, TokenKind.SLASH),
+)
+# Indexed by TokenKind value (0 = not a binary operator), so the operator loop
+# does a tuple index instead of hashing the kind
+_BINARY_PRECEDENCE = tuple(
+    next((prec for prec, kinds in enumerate(_PRECEDENCE_LEVELS, start=1) if kind in kinds), 0)
+    for kind in TokenKind
+)
+_REL_PREC = _BINARY_PRECEDENCE[TokenKind.LT]
+_TOP_PREC = len(_PRECEDENCE_LEVELS)
+
+
+# TokenKind members the rules test
+_ASSIGN = TokenKind.ASSIGN
+_COMMA = TokenKind.COMMA
+_ELSE_KW = TokenKind.ELSE_KW
+_EOF = TokenKind.EOF
+_IDENTIFIER = TokenKind.IDENTIFIER
+_LBRACE = TokenKind.LBRACE
+_LPAREN = TokenKind.LPAREN
+_NUMBER = TokenKind.NUMBER
+_RBRACE = TokenKind.RBRACE
+_RPAREN = TokenKind.RPAREN
+_SEMI = TokenKind.SEMI
+_VOID_KW = TokenKind.VOID_KW
 
 
 class ParserError(Exception):
@@ -15,70 +74,57 @@ class Parser:
         parser.parse_program()  # raises ParserError on syntax error
     """
 
+    # tokens/pos are read on every step; slots make those lookups direct
+    __slots__ = ('tokens', 'kinds', '_n', 'pos', '_stmt_dispatch')
+
     def __init__(self, tokens: list[Token]):
-        # Keep all tokens, but parser methods should *skip* comments/whitespace/newlines.
-        self.tokens = tokens
+        # Drop comments/whitespace/newlines once, up front; every parser
+        # method then works on significant tokens only.
+        self.tokens = [t for t in tokens if t.type not in TRIVIA]
+        # The list never changes after this, so bounds checks can use a cached length
+        self._n = len(self.tokens)
+        # End-of-input sentinel: peek() past the end returns it instead of None,
+        # so rule guards test its kind rather than checking for None first. It
+        # has no location, so errors at EOF still read "Syntax Error."
+        self.tokens.append(Token("", None, kind=TokenKind.EOF))
+        # Parallel kind column for the hot paths, which index it instead of
+        # dereferencing a Token; self.tokens keeps locations for errors.
+        # Rules only step past a token after matching a real kind, so pos never
+        # passes the sentinel and the kinds lookups need no bounds check.
+        self.kinds = [t.kind for t in self.tokens]
         self.pos = 0
 
+        # Statement rules bound to this parser, so parse_stmt dispatches with one lookup
+        self._stmt_dispatch = {kind: getattr(self, rule) for kind, rule in _STMT_RULES.items()}
+
     # --- Core helpers -----------------------------------------------------
+    # peek(), advance() and expect() are the token-level API for code driving
+    # a Parser; the grammar rules below read self.kinds directly.
 
     def _error(self) -> "ParserError":
         """Create a standardized ParserError message.
         Format: "Syntax Error at r:c." when location is available, else "Syntax Error."
         """
         tok = self.peek()
-        if tok is not None and getattr(tok, "line", None) is not None and getattr(tok, "column", None) is not None:
+        if getattr(tok, "line", None) is not None and getattr(tok, "column", None) is not None:
             return ParserError(f"Syntax Error at {tok.line}:{tok.column}.")
         return ParserError("Syntax Error.")
 
-    def _is_trivia(self, token: Token) -> bool:
-        return token.type in {
-            TokenType.COMMENT,
-            TokenType.WHITESPACE,
-            TokenType.NEWLINE,
-        }
-
-    def _skip_trivia(self) -> None:
-        while self.pos < len(self.tokens) and self._is_trivia(self.tokens[self.pos]):
-            self.pos += 1
+    def peek(self, n=0) -> Token:
+        """Return the n-th token from current position without consuming it.
+        Returns the EOF sentinel if there are fewer than n+1 tokens remaining.
+        """
+        idx = self.pos + n
+        return self.tokens[idx if idx < self._n else self._n]
 
-    def peek(self, n=0) -> Token | None:
-        """Return the n-th non-trivia token from current position without consuming it.
-        Handles lookahead that skips comments/whitespace/newlines.
-        Returns None if there are fewer than n+1 non-trivia tokens remaining.
+    def advance(self) -> Token:
+        """Consume and return current token.
+        At end of input the EOF sentinel is returned and not consumed, as with peek().
         """
-        # Start at first non-trivia token from current position
-        self._skip_trivia()
-        idx = self.pos
-
-        # If n == 0, just return current non-trivia token (if any)
-        if n == 0:
-            if idx < len(self.tokens):
-                return self.tokens[idx]
-            return None
-
-        # Walk forward, counting only non-trivia tokens
-        remaining = n
-        while idx < len(self.tokens) and remaining > 0:
-            idx += 1
-            # Skip any trivia we encounter at the new index
-            while idx < len(self.tokens) and self._is_trivia(self.tokens[idx]):
-                idx += 1
-            # We have advanced by one non-trivia token
-            remaining -= 1
-
-        # After advancing, return the token at idx if within bounds
-        if idx < len(self.tokens):
-            return self.tokens[idx]
-        return None
-
-    def advance(self) -> Token | None:
-        """Consume and return current non-trivia token, or None at end."""
-        tok = self.peek()
-        if tok is not None:
-            # peek() already skipped trivia and positioned on a real token
-            self.pos += 1
-        return tok
+        pos = self.pos
+        if pos < self._n:
+            self.pos = pos + 1
+        return self.tokens[pos]
 
     def expect(self, type_: TokenType | None = None, lexeme: str | None = None, advance: bool = True) -> Token:
         """Consume one token and validate type and/or lexeme.
@@ -86,7 +132,7 @@ class Parser:
         - If lexeme is not None: token.value must equal it.
         """
         tok = self.peek()
-        if tok is None:
+        if tok.kind is _EOF:
             raise self._error()
 
         if type_ is not None and tok.type is not type_:
@@ -99,12 +145,18 @@ class Parser:
             self.pos += 1
         return tok
 
+    def _expect_kind(self, kind: TokenKind) -> None:
+        """expect() for the common case: consume one token of the given kind."""
+        pos = self.pos
+        if self.kinds[pos] is not kind:
+            raise self._error()
+        self.pos = pos + 1
+
     def expect_eof(self) -> None:
-        """Ensure there are no remaining non-trivia tokens."""
-        if self.peek() is not None:
-            tok = self.peek()
+        """Ensure there are no remaining tokens."""
+        if self.kinds[self.pos] is not _EOF:
             raise self._error()
-    
+
 
     # --- Grammer Implementation ---
 
@@ -115,11 +167,7 @@ class Parser:
         This is intentionally minimal. You will progressively replace the
         body with calls to the real grammar methods (parse_decl_list, etc.).
         """
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int" , "float", "void"}:
+        if self.kinds[self.pos] in _FIRST_DECL:
             self.parse_decl_list()
             self.expect_eof()
         else :
@@ -127,403 +175,227 @@ class Parser:
 
     # Program        → DeclList EOF
     def parse_decl_list(self) -> None:
-        tok = self.peek()
-        #base case 
-        if tok is None:
-            return
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int" , "float", "void"}:
-            self.parse_decl()
-            self.parse_decl_list()
-        else:
-            raise self._error()
+        #base case: end of input
+        while (kind := self.kinds[self.pos]) is not _EOF:
+            if kind in _FIRST_DECL:
+                self.parse_decl()
+            else:
+                raise self._error()
 
     # Decl           → VarDecl | FunDecl
     def parse_decl(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int" , "float", "void"}:
-            #lookahead to decide between VarDecl and FunDecl
-            self.parse_type_spec()
-            id_token = self.expect(TokenType.IDENTIFIER)
-            next_token = self.peek()
-            if next_token is not None and next_token.value == '(':
-                # Function declaration
-                self.expect(lexeme='(')
-                self.parse_param_list()
-                self.expect(lexeme=')')
-                self.parse_compound_stmt()
-            else:
-                # Variable declaration
-                self.parse_var_decl_tail()
-                self.expect(lexeme=';')
+        # Only reached from parse_decl_list, which has already matched
+        # FIRST(Decl) on the current token, so that is not tested again.
+        #lookahead past TypeSpec ID to decide between VarDecl and FunDecl
+        next_token = self.peek(2)
+        self.pos += 1  # TypeSpec, already checked by the caller
+        self._expect_kind(_IDENTIFIER)
+        if next_token.kind is _LPAREN:
+            # Function declaration
+            self.pos += 1  # '(', already seen by the lookahead
+            self.parse_param_list()
+            self._expect_kind(_RPAREN)
+            self.parse_compound_stmt()
         else:
-            raise self._error()
-
-    # VarDecl        → TypeSpec ID VarDeclTail ';'
-    def parse_var_decl(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int", "void", "float"}:
-            self.parse_type_spec()
-            self.expect(TokenType.IDENTIFIER)
+            # Variable declaration
             self.parse_var_decl_tail()
-            self.expect(lexeme=';')
-        else:
-            raise self._error()
+            self._expect_kind(_SEMI)
 
     # VarDeclTail    → (',' ID)*
     def parse_var_decl_tail(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.value == ';':
-            return 
-        self.expect(lexeme=',')
-        self.expect(TokenType.IDENTIFIER)
-        self.parse_var_decl_tail()
+        kinds = self.kinds
+        identifier = _IDENTIFIER
+        pos = self.pos
+        while kinds[pos] is not _SEMI:
+            if kinds[pos] is not _COMMA:
+                self.pos = pos
+                raise self._error()
+            pos += 1
+            if kinds[pos] is not identifier:
+                self.pos = pos
+                raise self._error()
+            pos += 1
+        self.pos = pos
 
     # ParamList      → (TypeSpec ID (',' TypeSpec ID)*)?
     def parse_param_list(self) -> None:
-        tok = self.peek()
-        if tok is not None and ((tok.type == TokenType.KEYWORD and tok.value == "void") or tok.value == ')'):
-            if tok.value == "void":
-                self.advance()
+        kind = self.kinds[self.pos]
+        if kind in _EMPTY_PARAMS:
+            if kind is _VOID_KW:
+                self.pos += 1
             return
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int", "void", "float"}:
-            self.parse_type_spec()
-            self.expect(TokenType.IDENTIFIER)
-            self.parse_param_list_tail()
-        else:
-            raise self._error()
-
-    # ParamListTail  → (',' TypeSpec ID)*
-    def parse_param_list_tail(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.value == ')':
-            return
-        self.expect(lexeme=',')
-        self.parse_type_spec()
-        self.expect(TokenType.IDENTIFIER)
-        self.parse_param_list_tail()
-
-    # TypeSpec       → 'int' | 'float' | 'void'
-    def parse_type_spec(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int" , "float", "void"}:
-            self.advance()
-        else:
+        if kind not in _TYPE_SPECS:
             raise self._error()
+        self.pos += 1  # TypeSpec, already checked above
+        self._expect_kind(_IDENTIFIER)
+
+        # ParamListTail → (',' TypeSpec ID)*
+        kinds = self.kinds
+        identifier = _IDENTIFIER
+        pos = self.pos
+        while kinds[pos] is not _RPAREN:
+            if kinds[pos] is not _COMMA:
+                self.pos = pos
+                raise self._error()
+            pos += 1
+            if kinds[pos] not in _TYPE_SPECS:
+                self.pos = pos
+                raise self._error()
+            pos += 1
+            if kinds[pos] is not identifier:
+                self.pos = pos
+                raise self._error()
+            pos += 1
+        self.pos = pos
 
     # CompoundStmt   → '{' LocalDeclList StmtList '}'
     def parse_compound_stmt(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-        self.expect(lexeme='{')
+        self._expect_kind(_LBRACE)
         self.parse_local_decl_list()
         self.parse_stmt_list()
-        self.expect(lexeme='}')
+        self._expect_kind(_RBRACE)
 
     # LocalDeclList → (VarDecl)*
+    # VarDecl        → TypeSpec ID VarDeclTail ';'
     def parse_local_decl_list(self) -> None:
-        tok = self.peek()
-        # TODO: here you take a look ahead to decide whether to parse VarDecl or return (find better way?)
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value in {"int" , "float" , "void"}:
-            self.parse_var_decl()
-            self.parse_local_decl_list()
-        else:
-            return
+        # The loop condition already matched TypeSpec, so VarDecl is parsed inline
+        while self.kinds[self.pos] in _FIRST_DECL:
+            self.pos += 1
+            self._expect_kind(_IDENTIFIER)
+            self.parse_var_decl_tail()
+            self._expect_kind(_SEMI)
 
     # StmtList      → (Stmt)*
     # ID, '{',  if, while, for, return
     def parse_stmt_list(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            return
-        if tok is not None and (tok.type == TokenType.KEYWORD and tok.value in {"if", "while", "for", "return"}) or tok.value == '{' or tok.type == TokenType.IDENTIFIER:
-            self.parse_stmt()
-            self.parse_stmt_list()
-        else:
-            return
+        # The dispatch lookup doubles as the FIRST(Stmt) test, so each statement
+        # goes straight to its rule instead of being re-peeked by parse_stmt
+        dispatch = self._stmt_dispatch
+        while handler := dispatch.get(self.kinds[self.pos]):
+            handler()
 
     # Stmt          → ExprStmt | CompoundStmt | IfStmt | WhileStmt | ForStmt | ReturnStmt
     def parse_stmt(self) -> None:
-        tok = self.peek()
-        if tok is not None:
-            if tok.value == '{':
-                self.parse_compound_stmt()
-            elif tok.type == TokenType.KEYWORD and tok.value == "if":
-                self.parse_if_stmt()
-            elif tok.type == TokenType.KEYWORD and tok.value == "while":
-                self.parse_while_stmt()
-            elif tok.type == TokenType.KEYWORD and tok.value == "for":
-                self.parse_for_stmt()
-            elif tok.type == TokenType.KEYWORD and tok.value == "return":
-                self.parse_return_stmt()
-            elif tok.type == TokenType.IDENTIFIER:
-                self.parse_expr_stmt()
-            else:
-                raise self._error()
-        else:
+        handler = self._stmt_dispatch.get(self.kinds[self.pos])
+        if handler is None:
             raise self._error()
+        handler()
 
     # ExprStmt      → Expr ';' | ';'
     def parse_expr_stmt(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.value == ';':
-            self.expect(lexeme=';')
+        if self.kinds[self.pos] is _SEMI:
+            self.pos += 1
             return
         else:
             self.parse_expr()
-            self.expect(lexeme=';')
+            self._expect_kind(_SEMI)
 
     # IfStmt         → 'if' '(' Expr ')' Stmt ElsePart
     def parse_if_stmt(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-
-        self.expect(TokenType.KEYWORD, lexeme='if')
-        self.expect(lexeme='(')
+        self.pos += 1  # 'if', already matched by parse_stmt's dispatch
+        self._expect_kind(_LPAREN)
         self.parse_expr()
-        self.expect(lexeme=')')
+        self._expect_kind(_RPAREN)
         self.parse_stmt()
-        self.parse_else_part()
-
-    # ElsePart      → 'else' Stmt | ε
-    def parse_else_part(self) -> None:
-        tok = self.peek()
-        if tok is not None and tok.type == TokenType.KEYWORD and tok.value == 'else':
-            self.expect(lexeme='else')
+        # ElsePart → 'else' Stmt | ε
+        if self.kinds[self.pos] is _ELSE_KW:
+            self.pos += 1  # 'else', already checked above
             self.parse_stmt()
-        else:
-            return
 
     # WhileStmt      → 'while' '(' Expr ')' Stmt
     def parse_while_stmt(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-
-        self.expect(TokenType.KEYWORD, lexeme='while')
-        self.expect(lexeme='(')
+        self.pos += 1  # 'while', already matched by parse_stmt's dispatch
+        self._expect_kind(_LPAREN)
         self.parse_expr()
-        self.expect(lexeme=')')
+        self._expect_kind(_RPAREN)
         self.parse_stmt()
 
     # ForStmt        → 'for' '(' ExprStmt ExprStmt ExprOpt ')' Stmt
     def parse_for_stmt(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-
-        self.expect(TokenType.KEYWORD, lexeme='for')
-        self.expect(lexeme='(')
+        self.pos += 1  # 'for', already matched by parse_stmt's dispatch
+        self._expect_kind(_LPAREN)
         self.parse_expr_stmt()
         self.parse_expr_stmt()
-        self.parse_expr_opt()
-        self.expect(lexeme=')')
+        if self.kinds[self.pos] in _FIRST_EXPR:  # ExprOpt
+            self.parse_expr()
+        self._expect_kind(_RPAREN)
         self.parse_stmt()
 
     # ReturnStmt     → 'return' ExprOpt ';'
     def parse_return_stmt(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-
-        self.expect(TokenType.KEYWORD, lexeme='return')
-        self.parse_expr_opt()
-        self.expect(lexeme=';')
-
-    # ExprOpt       → Expr | ε
-    def parse_expr_opt(self) -> None:
-        tok = self.peek()
-        if tok is not None and (tok.type == TokenType.IDENTIFIER 
-                                or tok.type == TokenType.NUMERIC_CONSTANT
-                                or tok.value == '('):
+        self.pos += 1  # 'return', already matched by parse_stmt's dispatch
+        if self.kinds[self.pos] in _FIRST_EXPR:  # ExprOpt
             self.parse_expr()
-        else:
-            return
-
-    # Expr          → AssignExpr
-    def parse_expr(self) -> None:
-        """Expr → AssignExpr"""
-        return self.parse_assign_expr()
+        self._expect_kind(_SEMI)
 
     # AssignExpr    → ID = AssignExpr | OrExpr
     def parse_assign_expr(self) -> None:
         """AssignExpr → ID = AssignExpr | OrExpr"""
-        # Check if this is an assignment: ID = AssignExpr
-        tok = self.peek()
-
-        if (tok is not None and tok.type == TokenType.IDENTIFIER and 
-            self.peek(1) is not None and self.peek(1).value == '='):
-            self.expect(type_=TokenType.IDENTIFIER)
-        else:
-            return self.parse_or_expr()
-        last_pos = self.pos
-        next_tok = self.peek()
-        if next_tok is not None and next_tok.value == '=':
-            self.expect(lexeme='=')
-            return self.parse_assign_expr()
-        else:
-            self.pos = last_pos
-            # Not an assignment, parse as OrExpr
-            return self.parse_or_expr()
-
-    # OrExpr        → AndExpr OrExprTail
-    def parse_or_expr(self) -> None:
-        """OrExpr → AndExpr OrExprTail"""
-        self.parse_and_expr()
-        self.parse_or_expr_tail()
-
-    # OrExprTail    → || AndExpr OrExprTail | ε
-    def parse_or_expr_tail(self) -> None:
-        """OrExprTail → || AndExpr OrExprTail | ε"""
-        tok = self.peek()
-        if tok is not None and tok.value == '||':
-            self.expect(lexeme='||')
-            self.parse_and_expr()
-            self.parse_or_expr_tail()
-        # else: epsilon case, just return
-
-    # AndExpr       → RelExpr AndExprTail
-    def parse_and_expr(self) -> None:
-        """AndExpr → RelExpr AndExprTail"""
-        self.parse_rel_expr()
-        self.parse_and_expr_tail()
-
-    # AndExprTail   → && RelExpr AndExprTail | ε
-    def parse_and_expr_tail(self) -> None:
-        """AndExprTail → && RelExpr AndExprTail | ε"""
-        tok = self.peek()
-        if tok is not None and tok.value == '&&':
-            self.expect(lexeme='&&')
-            self.parse_rel_expr()
-            self.parse_and_expr_tail()
-        # else: epsilon case, just return
-
-    # RelExpr       → AddExpr RelOpTail
-    def parse_rel_expr(self) -> None:
-        """RelExpr → AddExpr RelOpTail"""
-        self.parse_add_expr()
-        self.parse_rel_op_tail()
-
-    # RelOpTail     → RelOp AddExpr | ε
-    def parse_rel_op_tail(self) -> None:
-        """RelOpTail → RelOp AddExpr | ε"""
-        tok = self.peek()
-        if tok is not None and tok.value in {'<', '<=', '>', '>=', '==', '!='}:
-            self.parse_rel_op()
-            self.parse_add_expr()
-        # else: epsilon case, just return
-
-    # RelOp         → '<' | '<=' | '>' | '>=' | '==' | '!='
-    def parse_rel_op(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
+        # The two-token lookahead settles the choice up front, so neither
+        # branch ever has to rewind and retry the other. Each 'ID =' of a
+        # chain (a = b = c) is consumed by the loop rather than a recursive call.
+        kinds = self.kinds
+        while kinds[self.pos] is _IDENTIFIER and kinds[self.pos + 1] is _ASSIGN:
+            self.pos += 2  # ID '=', both matched by the lookahead
+        # Not (or no longer) an assignment, parse as OrExpr
+        return self.parse_binary_expr()
 
-        valid_ops = {'<', '<=', '>', '>=', '==', '!='}
-        if tok.value in valid_ops:
-            self.advance()
-            return tok.value
-        else:
-            raise self._error()
+    # Expr          → AssignExpr
+    # A unit production: bind the same function rather than add a frame per expression
+    parse_expr = parse_assign_expr
 
-    # AddExpr       → Term AddExprTail
-    def parse_add_expr(self) -> None:
-        """AddExpr → Term AddExprTail"""
-        self.parse_term()
-        self.parse_add_expr_tail()
+    # OrExpr / AndExpr / RelExpr / AddExpr / Term, by precedence climbing
+    def parse_binary_expr(self, min_prec: int = 1) -> None:
+        """Factor (BinOp Factor)* for operators binding at least as tightly as min_prec.
 
-    # AddExprTail   → + Term AddExprTail | - Term AddExprTail | ε
-    def parse_add_expr_tail(self) -> None:
-        """AddExprTail → + Term AddExprTail | - Term AddExprTail | ε"""
-        tok = self.peek()
-        if tok is not None and tok.value in {'+', '-'}:
-            self.advance()  # consume + or -
-            self.parse_term()
-            self.parse_add_expr_tail()
-        # else: epsilon case, just return
-
-    # Term          → Factor TermTail
-    def parse_term(self) -> None:
+        Covers OrExpr → AndExpr OrExprTail down to Term → Factor TermTail
+        in one loop, using _BINARY_PRECEDENCE instead of one method per level.
+        """
         self.parse_factor()
-        self.parse_term_tail()
-    
-    # TermTail → * Factor TermTail | / Factor TermTail | ε
-    def parse_term_tail(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            return  # ε case
-        
-        if tok.value == '*':
-            self.expect(lexeme='*') 
-        elif tok.value == '/':
-            self.expect(lexeme='/')
-        else:
-            return  # ε case
+        kinds = self.kinds
+        max_prec = _TOP_PREC
+        # The EOF sentinel has precedence 0, so it ends the loop like any non-operator
+        while True:
+            pos = self.pos
+            prec = _BINARY_PRECEDENCE[kinds[pos]]
+            if prec < min_prec or prec > max_prec:
+                return
+            self.pos = pos + 1
+            if prec == _TOP_PREC:
+                # Nothing binds tighter than Term: its operand is a bare Factor
+                self.parse_factor()
+            else:
+                self.parse_binary_expr(prec + 1)
+            # Left-associative levels may repeat; RelOpTail → RelOp AddExpr | ε
+            # allows only one relational operator per RelExpr.
+            max_prec = prec - 1 if prec == _REL_PREC else prec
 
-        self.parse_factor()
-        self.parse_term_tail()
-        # else: ε case (no * or /)
-    
     # Factor → ( Expr ) | ID FactorTail | Literal
     def parse_factor(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-        
-        if tok.value == '(':
-            self.expect(lexeme='(')
+        kind = self.kinds[self.pos]
+        if kind is _LPAREN:
+            self.pos += 1  # consume '('
             self.parse_expr()  # parse the expression inside parentheses
-            self.expect(lexeme=')')  # consume ')'
-        elif tok.type == TokenType.IDENTIFIER:
-            self.expect(type_=TokenType.IDENTIFIER)
-            self.parse_factor_tail()  # check for function call
-        elif tok.type == TokenType.NUMERIC_CONSTANT:
-            self.parse_literal()
-        else:
-            raise self._error()
-    
-    # FactorTail → ( ArgList ) | ε
-    def parse_factor_tail(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            return  # ε case (end of input)
-        
-        if tok.value == '(':
-            self.expect(lexeme='(')  # consume '('
-            self.parse_arg_list()  # parse the argument list
-            self.expect(lexeme=')')  # consume ')'
-        else:
-            return
-    
-    # ArgList → Expr ArgListTail | ε
-    def parse_arg_list(self) -> None:
-        tok = self.peek()
-        if tok is None or tok.value == ')':
-            return  # ε case (empty argument list)
-
-        self.parse_expr()  # parse first expression
-        self.parse_arg_list_tail()  # parse remaining arguments
-    
-    # ArgListTail → , Expr ArgListTail | ε
-    def parse_arg_list_tail(self) -> None:
-        tok = self.peek()
-        if tok is None or tok.value == ')':
-            return  # ε case (no more arguments)
-        
-        if tok.value == ',':
-            self.expect(lexeme=',')  # consume ','
-            self.parse_expr()  # parse next expression
-            self.parse_arg_list_tail()  # recursive call for more arguments
+            self._expect_kind(_RPAREN)  # consume ')'
+        elif kind is _IDENTIFIER:
+            self.pos += 1
+            # FactorTail → ( ArgList ) | ε
+            if self.kinds[self.pos] is _LPAREN:
+                self.pos += 1  # consume '('
+                # ArgList → Expr ArgListTail | ε
+                if self.kinds[self.pos] is not _RPAREN:
+                    self.parse_expr()  # parse first expression
+                    # ArgListTail → , Expr ArgListTail | ε
+                    while (kind := self.kinds[self.pos]) is not _RPAREN:
+                        if kind is _COMMA:
+                            self.pos += 1  # consume ','
+                            self.parse_expr()  # parse next expression
+                        else:
+                            raise self._error()
+                self._expect_kind(_RPAREN)  # consume ')'
+        elif kind is _NUMBER:
+            self.pos += 1  # Literal → INT_CONST | FLOAT_CONST
         else:
             raise self._error()
-    
-    # Literal → INT_CONST | FLOAT_CONST
-    def parse_literal(self) -> None:
-        tok = self.peek()
-        if tok is None:
-            raise self._error()
-        
-        self.expect(type_=TokenType.NUMERIC_CONSTANT)
 
     
\ No newline at end of file
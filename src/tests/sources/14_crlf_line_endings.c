@@ -0,0 +1,6 @@
+int main(void) {
+  int x;
+  // CRLF line endings
+  x = 1;
+  return;
+}
@@ -0,0 +1,5 @@
+int main(void) {
+  int c;
+  c = 'é';
+  return;
+}